@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import re
 import shutil
 import subprocess
 import sys
 import time
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, TextIO
+
+try:
+    import orjson
+except ImportError:  # optional speedup for mapping writes
+    orjson = None
 
 # Error message constants
 ERROR_TASKS_NOT_FOUND = "tasks.md not found"
@@ -24,14 +31,19 @@ ERROR_PARTIAL_FAILURE = "Some beads failed to create"
 CURRENT_MAPPING_VERSION = "1.0"
 
 # Task line format: "- [ ] T001 [P] [US1] Description (depends on T002, T003)"
-TASK_PATTERN = re.compile(
-    r"^- \[ \] (T\d{3})\s*(\[P\])?\s*(\[US\d+\])?\s+(.+)$"
-)
+_TASK_LINE_RE = r"- \[ \] (?P<tid>T\d{3})\s*(?P<par>\[P\])?\s*(?P<us>\[US\d+\])?\s+(?P<desc>.+)"
+_PHASE_HEADER_RE = r"##\s+Phase\s+\d+:\s+(?P<phase>.+)"
+TASK_PATTERN = re.compile(rf"^{_TASK_LINE_RE}$")
 # Explicit dependency notation within a task description
 DEPENDS_PATTERN = re.compile(r"\(depends on (T\d{3}(?:,\s*T\d{3})*)\)")
-PHASE_HEADER_PATTERN = re.compile(r"^##\s+Phase\s+\d+:\s+(.+)$")
+PHASE_HEADER_PATTERN = re.compile(rf"^{_PHASE_HEADER_RE}$")
+# Phase headers and task lines fused so each line is matched only once
+LINE_PATTERN = re.compile(rf"^(?:{_PHASE_HEADER_RE}|{_TASK_LINE_RE})$")
 BEAD_ID_PATTERN = re.compile(r"\b([A-Za-z][A-Za-z0-9]*-[A-Za-z0-9]+(?:\.\d+)*)\b")
 CONVOY_ID_PATTERN = re.compile(r"\b(gt-[A-Za-z0-9]+)\b")
+FILE_PATH_PATTERN = re.compile(r"([A-Za-z0-9_./-]+/[A-Za-z0-9_./-]+\.[A-Za-z0-9]+)")
+PRIORITY_PATTERN = re.compile(r"Priority:\s*P(\d+)")
+TASK_ID_VALIDATE = re.compile(r"T\d{3}")
 
 PHASE_PRIORITY_MAP = {
     "Setup": 0,
@@ -92,19 +104,22 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _log_line(log_file: Optional[Path], message: str) -> None:
-    """Append a timestamped line to the log file if configured."""
-    if not log_file:
+def _log_line(log_handle: Optional[TextIO], message: str) -> None:
+    """Write a timestamped line to the open log handle if configured."""
+    if not log_handle:
         return
-    timestamp = datetime.now(timezone.utc).isoformat()
-    log_file.parent.mkdir(parents=True, exist_ok=True)
-    with log_file.open("a", encoding="utf-8") as handle:
-        handle.write(f"[{timestamp}] {message}\n")
+    log_handle.write(f"[{_now_iso()}] {message}\n")
+
+
+@functools.lru_cache(maxsize=8)
+def _which(command: str, search_path: Optional[str]) -> Optional[str]:
+    """Resolve a command once per PATH value for the lifetime of the process."""
+    return shutil.which(command, path=search_path)
 
 
 def check_cli_available(command: str) -> bool:
     """Check if a CLI command is available in PATH."""
-    return shutil.which(command) is not None
+    return _which(command, os.environ.get("PATH")) is not None
 
 
 def _run_command(command: str, args: list[str], timeout: int = 30) -> tuple[int, str, str]:
@@ -147,7 +162,7 @@ def _map_priority_from_phase(phase_name: str) -> int:
     for key, priority in PHASE_PRIORITY_MAP.items():
         if key in phase_name:
             return min(max(priority, 0), 4)
-    match = re.search(r"Priority:\s*P(\d+)", phase_name)
+    match = PRIORITY_PATTERN.search(phase_name)
     if match:
         return min(max(int(match.group(1)) + 1, 0), 4)
     return min(max(DEFAULT_PRIORITY, 0), 4)
@@ -155,7 +170,7 @@ def _map_priority_from_phase(phase_name: str) -> int:
 
 def _extract_file_path(description: str) -> Optional[str]:
     """Try to extract a file path from a task description."""
-    match = re.search(r"([A-Za-z0-9_./-]+/[A-Za-z0-9_./-]+\.[A-Za-z0-9]+)", description)
+    match = FILE_PATH_PATTERN.search(description)
     if match:
         return match.group(1)
     return None
@@ -168,7 +183,8 @@ def parse_dependencies(description: str) -> tuple[list[str], str]:
         return [], description.strip()
     deps_str = match.group(1)
     deps = [dep.strip() for dep in deps_str.split(",") if dep.strip()]
-    cleaned = DEPENDS_PATTERN.sub("", description).strip()
+    # Reuse the match instead of rescanning the prefix; only the tail can hold more notations.
+    cleaned = (description[: match.start()] + DEPENDS_PATTERN.sub("", description[match.end():])).strip()
     return deps, cleaned
 
 
@@ -179,70 +195,74 @@ def parse_tasks_file(tasks_path: Path) -> list[Task]:
 
     tasks: list[Task] = []
     current_phase: Optional[str] = None
+    current_phase_priority = DEFAULT_PRIORITY
     last_non_parallel_by_phase: dict[str, Optional[str]] = {}
 
-    lines = tasks_path.read_text(encoding="utf-8").splitlines()
-    for index, raw_line in enumerate(lines, start=1):
-        line = raw_line.rstrip()
-        phase_name = parse_phase_header(line)
-        if phase_name:
-            current_phase = phase_name
-            if current_phase not in last_non_parallel_by_phase:
-                last_non_parallel_by_phase[current_phase] = None
-            continue
-
-        if not line.strip().startswith("- [ ]"):
-            continue
-
-        if not current_phase:
-            raise ValueError(f"{ERROR_MALFORMED_TASKS} at line {index}: missing phase header")
-
-        match = TASK_PATTERN.match(line.strip())
-        if not match:
-            # Malformed task line handling: warn and skip
-            sys.stderr.write(
-                f"Warning: Malformed task line at {index}: {line.strip()}\n"
-            )
-            continue
-
-        task_id = match.group(1)
-        is_parallel = bool(match.group(2))
-        user_story_raw = match.group(3)
-        user_story = user_story_raw.strip("[]") if user_story_raw else None
-        description_raw = match.group(4).strip()
-
-        dependencies, description = parse_dependencies(description_raw)
-        if not description.strip():
-            sys.stderr.write(
-                f"Warning: Skipping empty task description at line {index} ({task_id})\n"
-            )
-            continue
-        file_path = _extract_file_path(description)
-        phase_priority = _map_priority_from_phase(current_phase)
+    # Stream the file so peak memory stays bounded by the longest line.
+    with tasks_path.open("r", encoding="utf-8") as handle:
+        for index, raw_line in enumerate(handle, start=1):
+            stripped = raw_line.strip()
+            match = LINE_PATTERN.match(stripped)
+            if not match:
+                if not stripped.startswith("- [ ]"):
+                    continue
+                if not current_phase:
+                    raise ValueError(f"{ERROR_MALFORMED_TASKS} at line {index}: missing phase header")
+                # Malformed task line handling: warn and skip
+                sys.stderr.write(
+                    f"Warning: Malformed task line at {index}: {stripped}\n"
+                )
+                continue
 
-        implicit_dep = None
-        if not is_parallel:
-            implicit_dep = last_non_parallel_by_phase.get(current_phase)
+            phase_name = match.group("phase")
+            if phase_name:
+                current_phase = phase_name.strip()
+                current_phase_priority = _map_priority_from_phase(current_phase)
+                if current_phase not in last_non_parallel_by_phase:
+                    last_non_parallel_by_phase[current_phase] = None
+                continue
 
-        if implicit_dep and implicit_dep not in dependencies:
-            dependencies.append(implicit_dep)
+            if not current_phase:
+                raise ValueError(f"{ERROR_MALFORMED_TASKS} at line {index}: missing phase header")
 
-        if not is_parallel:
-            last_non_parallel_by_phase[current_phase] = task_id
+            task_id = match.group("tid")
+            is_parallel = bool(match.group("par"))
+            user_story_raw = match.group("us")
+            user_story = user_story_raw.strip("[]") if user_story_raw else None
+            # The line is already stripped and the pattern starts desc after whitespace.
+            description_raw = match.group("desc")
 
-        tasks.append(
-            Task(
-                task_id=task_id,
-                is_parallel=is_parallel,
-                user_story=user_story,
-                description=description,
-                file_path=file_path,
-                dependencies=dependencies,
-                phase_name=current_phase,
-                phase_priority=phase_priority,
-                line_number=index,
+            dependencies, description = parse_dependencies(description_raw)
+            if not description:
+                sys.stderr.write(
+                    f"Warning: Skipping empty task description at line {index} ({task_id})\n"
+                )
+                continue
+            file_path = _extract_file_path(description)
+
+            implicit_dep = None
+            if not is_parallel:
+                implicit_dep = last_non_parallel_by_phase.get(current_phase)
+
+            if implicit_dep and implicit_dep not in dependencies:
+                dependencies.append(implicit_dep)
+
+            if not is_parallel:
+                last_non_parallel_by_phase[current_phase] = task_id
+
+            tasks.append(
+                Task(
+                    task_id=task_id,
+                    is_parallel=is_parallel,
+                    user_story=user_story,
+                    description=description,
+                    file_path=file_path,
+                    dependencies=dependencies,
+                    phase_name=current_phase,
+                    phase_priority=current_phase_priority,
+                    line_number=index,
+                )
             )
-        )
 
     if not tasks:
         raise ValueError("tasks.md contains no tasks")
@@ -252,9 +272,14 @@ def parse_tasks_file(tasks_path: Path) -> list[Task]:
 
 def validate_task_ids(tasks: list[Task]) -> None:
     """Validate task IDs for format and uniqueness."""
+    ids = [task.task_id for task in tasks]
+    fullmatch = TASK_ID_VALIDATE.fullmatch
+    if all(map(fullmatch, ids)) and len(set(ids)) == len(ids):
+        return
+    # Slow path only on failure, so the first offending task is reported.
     seen: set[str] = set()
     for task in tasks:
-        if not re.fullmatch(r"T\d{3}", task.task_id):
+        if not TASK_ID_VALIDATE.fullmatch(task.task_id):
             raise ValueError(f"Invalid task ID: {task.task_id}")
         if task.task_id in seen:
             raise ValueError(f"Duplicate task ID detected: {task.task_id}")
@@ -275,35 +300,55 @@ def validate_dependency_targets(tasks: list[Task]) -> None:
     validate_dependencies(tasks)
 
 
-def detect_circular_dependencies(tasks: list[Task]) -> Optional[list[str]]:
-    """Detect circular dependencies. Returns cycle path if found."""
+def sort_tasks_by_dependencies(tasks: list[Task]) -> tuple[list[Task], Optional[list[str]]]:
+    """Order tasks so dependencies come first, detecting cycles in the same pass.
+
+    Returns (ordered_tasks, cycle). Tasks already listed after their dependencies
+    keep their file order. If a cycle is found, ordered_tasks is empty and cycle
+    holds the offending path.
+    """
     graph = {task.task_id: task.dependencies for task in tasks}
+    tasks_by_id = {task.task_id: task for task in tasks}
     visiting: set[str] = set()
     visited: set[str] = set()
-    stack: list[str] = []
+    parent: dict[str, str] = {}
+    order: list[Task] = []
 
-    def dfs(node: str) -> Optional[list[str]]:
-        visiting.add(node)
-        stack.append(node)
-        for neighbor in graph.get(node, []):
+    for root in graph:
+        if root in visited:
+            continue
+        visiting.add(root)
+        stack = [(root, iter(graph[root]))]
+        while stack:
+            node, neighbors = stack[-1]
+            neighbor = next(neighbors, None)
+            if neighbor is None:
+                stack.pop()
+                visiting.remove(node)
+                visited.add(node)
+                order.append(tasks_by_id[node])
+                continue
             if neighbor in visiting:
-                cycle_start = stack.index(neighbor)
-                return stack[cycle_start:] + [neighbor]
-            if neighbor not in visited:
-                cycle = dfs(neighbor)
-                if cycle:
-                    return cycle
-        visiting.remove(node)
-        visited.add(node)
-        stack.pop()
-        return None
+                # Walk back-pointers so extracting the cycle costs O(cycle length).
+                cycle = []
+                current = node
+                while current != neighbor:
+                    cycle.append(current)
+                    current = parent[current]
+                cycle.append(neighbor)
+                cycle.reverse()
+                return [], cycle + [neighbor]
+            if neighbor not in visited and neighbor in graph:
+                visiting.add(neighbor)
+                parent[neighbor] = node
+                stack.append((neighbor, iter(graph[neighbor])))
+    return order, None
 
-    for node in graph:
-        if node not in visited:
-            cycle = dfs(node)
-            if cycle:
-                return cycle
-    return None
+
+def detect_circular_dependencies(tasks: list[Task]) -> Optional[list[str]]:
+    """Detect circular dependencies. Returns cycle path if found."""
+    _, cycle = sort_tasks_by_dependencies(tasks)
+    return cycle
 
 
 def validate_beads_initialized(repo_root: Path) -> bool:
@@ -313,16 +358,33 @@ def validate_beads_initialized(repo_root: Path) -> bool:
 
 
 def load_mapping(feature_dir: Path) -> Optional[TaskBeadMapping]:
-    """Load existing mapping file or return None if it doesn't exist."""
+    """Load existing mapping file or return None if it doesn't exist.
+
+    A checkpoint left behind by an interrupted run is preferred when it is at
+    least as new as the final file and still parses.
+    """
     mapping_path = feature_dir / "beads-mapping.json"
-    if not mapping_path.exists():
-        return None
-    try:
-        data = json.loads(mapping_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
-        backup = mapping_path.with_suffix(".json.bak")
-        mapping_path.rename(backup)
-        return None
+    inflight_path = mapping_path.with_suffix(".json.inflight")
+    data = None
+    if inflight_path.exists() and (
+        not mapping_path.exists()
+        or inflight_path.stat().st_mtime_ns >= mapping_path.stat().st_mtime_ns
+    ):
+        try:
+            data = json.loads(inflight_path.read_text(encoding="utf-8"))
+        except ValueError:
+            # Torn checkpoint (bad JSON or a split UTF-8 character); use the last complete save.
+            data = None
+
+    if data is None:
+        if not mapping_path.exists():
+            return None
+        try:
+            data = json.loads(mapping_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            backup = mapping_path.with_suffix(".json.bak")
+            mapping_path.rename(backup)
+            return None
 
     version = data.get("version", CURRENT_MAPPING_VERSION)
     if version != CURRENT_MAPPING_VERSION:
@@ -360,25 +422,68 @@ def load_mapping(feature_dir: Path) -> Optional[TaskBeadMapping]:
     )
 
 
-def save_mapping(mapping: TaskBeadMapping, feature_dir: Path) -> None:
-    """Save mapping file with atomic write."""
-    mapping.last_updated = _now_iso()
-    mapping_path = feature_dir / "beads-mapping.json"
-    tmp_path = mapping_path.with_suffix(".json.tmp")
+def _entry_to_dict(entry: BeadMappingEntry) -> dict[str, Any]:
+    """Serialize a mapping entry without dataclasses.asdict's deep copy."""
+    return {
+        "bead_id": entry.bead_id,
+        "created_at": entry.created_at,
+        "title": entry.title,
+        "parent_bead_id": entry.parent_bead_id,
+    }
+
+
+def _convoy_to_dict(convoy: ConvoyInfo) -> dict[str, Any]:
+    """Serialize convoy info without dataclasses.asdict's deep copy."""
+    return {
+        "convoy_id": convoy.convoy_id,
+        "convoy_name": convoy.convoy_name,
+        "created_at": convoy.created_at,
+        "bead_ids": list(convoy.bead_ids),
+    }
 
+
+def _dump_json_bytes(data: dict[str, Any]) -> bytes:
+    """Serialize mapping data as compact UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _serialize_mapping(mapping: TaskBeadMapping) -> bytes:
+    """Encode the mapping file contents."""
     serialized = {
         "version": mapping.version,
         "feature_dir": mapping.feature_dir,
         "branch_name": mapping.branch_name,
         "created_at": mapping.created_at,
         "last_updated": mapping.last_updated,
-        "mappings": {key: asdict(entry) for key, entry in mapping.mappings.items()},
-        "convoy": asdict(mapping.convoy) if mapping.convoy else None,
+        "mappings": {key: _entry_to_dict(entry) for key, entry in mapping.mappings.items()},
+        "convoy": _convoy_to_dict(mapping.convoy) if mapping.convoy else None,
         "stats": mapping.stats,
     }
+    return _dump_json_bytes(serialized)
 
-    tmp_path.write_text(json.dumps(serialized, indent=2), encoding="utf-8")
+
+def save_mapping(mapping: TaskBeadMapping, feature_dir: Path) -> None:
+    """Save mapping file with atomic write."""
+    mapping.last_updated = _now_iso()
+    mapping_path = feature_dir / "beads-mapping.json"
+    tmp_path = mapping_path.with_suffix(".json.tmp")
+
+    tmp_path.write_bytes(_serialize_mapping(mapping))
     tmp_path.replace(mapping_path)
+    mapping_path.with_suffix(".json.inflight").unlink(missing_ok=True)
+
+
+def save_mapping_fast(mapping: TaskBeadMapping, feature_dir: Path) -> None:
+    """Write a checkpoint in place, skipping the tmp file and rename.
+
+    load_mapping only trusts the checkpoint if it parses, so a torn write falls
+    back to the last atomic save.
+    """
+    mapping.last_updated = _now_iso()
+    inflight_path = (feature_dir / "beads-mapping.json").with_suffix(".json.inflight")
+    inflight_path.write_bytes(_serialize_mapping(mapping))
 
 
 def load_existing_mapping(feature_dir: Path) -> TaskBeadMapping:
@@ -406,13 +511,11 @@ def is_duplicate(task_id: str, mapping: TaskBeadMapping) -> bool:
 
 def filter_duplicate_tasks(tasks: list[Task], mapping: TaskBeadMapping) -> tuple[list[Task], list[Task]]:
     """Split tasks into new and existing based on mapping."""
+    existing_ids = mapping.mappings.keys()
     new_tasks: list[Task] = []
     existing_tasks: list[Task] = []
     for task in tasks:
-        if is_duplicate(task.task_id, mapping):
-            existing_tasks.append(task)
-        else:
-            new_tasks.append(task)
+        (existing_tasks if task.task_id in existing_ids else new_tasks).append(task)
     return new_tasks, existing_tasks
 
 
@@ -471,13 +574,14 @@ def determine_parent_bead(task: Task) -> tuple[str, str]:
 
 def _parse_bead_id(output: str) -> Optional[str]:
     """Extract bead ID from bd stdout."""
-    match = BEAD_ID_PATTERN.search(output)
+    # Quiet/ID-only output is a single line; anything longer needs the first match in the text.
+    match = ("\n" not in output and BEAD_ID_PATTERN.fullmatch(output)) or BEAD_ID_PATTERN.search(output)
     return match.group(1) if match else None
 
 
 def _parse_convoy_id(output: str) -> Optional[str]:
     """Extract convoy ID from gt stdout."""
-    match = CONVOY_ID_PATTERN.search(output)
+    match = ("\n" not in output and CONVOY_ID_PATTERN.fullmatch(output)) or CONVOY_ID_PATTERN.search(output)
     return match.group(1) if match else None
 
 
@@ -528,10 +632,12 @@ def create_beads_from_tasks(
     mapping: TaskBeadMapping,
     repo_root: Path,
     feature_dir: Path,
-    log_file: Optional[Path],
+    log_handle: Optional[TextIO],
     prefix: Optional[str] = None,
 ) -> dict[str, Any]:
     """Create beads for tasks and update mapping. Returns result stats."""
+    # One created_at for the whole batch; log lines still get their own timestamps.
+    batch_ts = _now_iso()
     context_files = get_context_files(feature_dir)
     created_beads: list[tuple[str, str]] = []
     failed: dict[str, str] = {}
@@ -540,7 +646,9 @@ def create_beads_from_tasks(
     new_tasks, existing_tasks = filter_duplicate_tasks(tasks, mapping)
     skipped = [task.task_id for task in existing_tasks]
 
-    for task in new_tasks:
+    # Checkpoint roughly ten times per run instead of rewriting the mapping per bead.
+    checkpoint_every = max(1, len(new_tasks) // 10)
+    for position, task in enumerate(new_tasks, start=1):
         description = format_bead_description(task, context_files, repo_root)
         try:
             bead_id = create_bead(
@@ -551,17 +659,21 @@ def create_beads_from_tasks(
             )
             mapping.mappings[task.task_id] = BeadMappingEntry(
                 bead_id=bead_id,
-                created_at=_now_iso(),
+                created_at=batch_ts,
                 title=task.description,
                 parent_bead_id=None,
             )
             created_beads.append((task.task_id, bead_id))
-            save_mapping(mapping, feature_dir)
-            _log_line(log_file, f"Created bead {bead_id} for {task.task_id}")
+            _log_line(log_handle, f"Created bead {bead_id} for {task.task_id}")
         except Exception as exc:
             failed[task.task_id] = str(exc)
-            _log_line(log_file, f"Failed to create bead for {task.task_id}: {exc}")
-            continue
+            _log_line(log_handle, f"Failed to create bead for {task.task_id}: {exc}")
+        # Failed tasks still count toward the cadence so a failure never skips a checkpoint.
+        if created_beads and position % checkpoint_every == 0:
+            save_mapping_fast(mapping, feature_dir)
+
+    if created_beads:
+        save_mapping(mapping, feature_dir)
 
     return {
         "created": created_beads,
@@ -572,7 +684,11 @@ def create_beads_from_tasks(
     }
 
 
-def create_bead_dependencies(tasks: list[Task], mapping: TaskBeadMapping, log_file: Optional[Path]) -> list[str]:
+def create_bead_dependencies(
+    tasks: list[Task],
+    mapping: TaskBeadMapping,
+    log_handle: Optional[TextIO],
+) -> list[str]:
     """Create bead dependencies via bd dep add. Returns warnings."""
     warnings: list[str] = []
     for task in tasks:
@@ -593,7 +709,7 @@ def create_bead_dependencies(tasks: list[Task], mapping: TaskBeadMapping, log_fi
                     f"depends on {dep_id} ({parent_entry.bead_id}): {stderr}"
                 )
                 warnings.append(message)
-                _log_line(log_file, message)
+                _log_line(log_handle, message)
     return warnings
 
 
@@ -618,7 +734,7 @@ def _get_git_branch(repo_root: Path) -> Optional[str]:
     """Return the current git branch name, if available."""
     try:
         result = subprocess.run(
-            ["git", "-C", str(repo_root), "rev-parse", "--abbrev-ref", "HEAD"],
+            ["git", "-C", str(repo_root), "symbolic-ref", "--quiet", "--short", "HEAD"],
             capture_output=True,
             text=True,
             check=False,
@@ -646,13 +762,7 @@ def get_branch_name(repo_root: Path, feature_dir: Path) -> str:
 
 def get_convoy_name(repo_root: Path, feature_dir: Path) -> str:
     """Determine convoy name from branch name or spec title."""
-    branch = _get_git_branch(repo_root)
-    if branch:
-        return branch
-    spec_title = _read_spec_title(feature_dir)
-    if spec_title:
-        return spec_title
-    return feature_dir.name
+    return get_branch_name(repo_root, feature_dir)
 
 
 def create_convoy(
@@ -701,9 +811,11 @@ def run_taskstoepic(
         tasks = parse_tasks_file(tasks_path)
         validate_task_ids(tasks)
         validate_dependency_targets(tasks)
-        cycle = detect_circular_dependencies(tasks)
+        # Create beads in dependency order so every dep edge targets an existing bead.
+        ordered_tasks, cycle = sort_tasks_by_dependencies(tasks)
         if cycle:
             raise ValueError(f"{ERROR_CIRCULAR_DEPS}: {' -> '.join(cycle)}")
+        tasks = ordered_tasks
         phase_timings["parse"] = time.monotonic() - start
     except FileNotFoundError as exc:
         return 1, {"error": str(exc)}
@@ -718,20 +830,23 @@ def run_taskstoepic(
     mapping = load_existing_mapping(feature_dir)
     mapping.branch_name = get_branch_name(repo_root, feature_dir)
 
-    start = time.monotonic()
-    bead_results = create_beads_from_tasks(
-        tasks=tasks,
-        mapping=mapping,
-        repo_root=repo_root,
-        feature_dir=feature_dir,
-        log_file=log_file,
-        prefix=prefix,
-    )
-    phase_timings["beads"] = time.monotonic() - start
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    # Keep the log open for the whole run instead of reopening it per line.
+    with log_file.open("a", encoding="utf-8", buffering=1) as log_handle:
+        start = time.monotonic()
+        bead_results = create_beads_from_tasks(
+            tasks=tasks,
+            mapping=mapping,
+            repo_root=repo_root,
+            feature_dir=feature_dir,
+            log_handle=log_handle,
+            prefix=prefix,
+        )
+        phase_timings["beads"] = time.monotonic() - start
 
-    start = time.monotonic()
-    dep_warnings = create_bead_dependencies(tasks, mapping, log_file=log_file)
-    phase_timings["dependencies"] = time.monotonic() - start
+        start = time.monotonic()
+        dep_warnings = create_bead_dependencies(tasks, mapping, log_handle=log_handle)
+        phase_timings["dependencies"] = time.monotonic() - start
 
     convoy_info = None
     convoy_warning = None
@@ -739,7 +854,8 @@ def run_taskstoepic(
         if bead_results["created"]:
             start = time.monotonic()
             try:
-                convoy_name = get_convoy_name(repo_root, feature_dir)
+                # Convoy naming shares the branch lookup resolved above.
+                convoy_name = mapping.branch_name
                 # Batch all bead IDs into a single convoy create call.
                 convoy_info = create_convoy(convoy_name, _collect_bead_ids(mapping))
                 mapping.convoy = convoy_info
@@ -771,7 +887,7 @@ def run_taskstoepic(
         "skipped": bead_results["skipped"],
         "failed": bead_results["failed"],
         "dependency_warnings": dep_warnings,
-        "convoy": asdict(convoy_info) if convoy_info else None,
+        "convoy": _convoy_to_dict(convoy_info) if convoy_info else None,
         "convoy_warning": convoy_warning,
         "duration": duration,
         "user_input": user_input,
@@ -791,54 +907,58 @@ def _render_report(exit_code: int, result: dict[str, Any], feature_dir: Path) ->
     failed = result.get("failed", {})
     convoy = result.get("convoy")
     convoy_warning = result.get("convoy_warning")
+    # Build the report in memory and emit it with a single write.
+    lines: list[str] = []
 
     if exit_code == 0:
-        print("✓ Tasks-to-Epic Bridge Complete")
+        lines.append("✓ Tasks-to-Epic Bridge Complete")
     elif exit_code == 6:
-        print("⚠ Tasks-to-Epic Bridge Completed with Warnings")
+        lines.append("⚠ Tasks-to-Epic Bridge Completed with Warnings")
     else:
         sys.stderr.write(result.get("error", "Unknown error") + "\n")
         return
 
     if convoy_warning and exit_code in (0, 6):
-        print(convoy_warning)
+        lines.append(convoy_warning)
 
-    print("")
-    print(f"Beads Created: {len(created)}")
-    print(f"Skipped (duplicates): {len(skipped)}")
-    print(f"Failed: {len(failed)}")
+    lines.append("")
+    lines.append(f"Beads Created: {len(created)}")
+    lines.append(f"Skipped (duplicates): {len(skipped)}")
+    lines.append(f"Failed: {len(failed)}")
 
     if created_parents or created:
-        print("")
-        print("Created Beads:")
+        lines.append("")
+        lines.append("Created Beads:")
         for title, bead_id in created_parents:
-            print(f"  - {bead_id} ({title})")
+            lines.append(f"  - {bead_id} ({title})")
         for task_id, bead_id in created:
-            print(f"  - {bead_id} ({task_id})")
+            lines.append(f"  - {bead_id} ({task_id})")
 
     if failed:
-        print("")
-        print("Failed Tasks:")
+        lines.append("")
+        lines.append("Failed Tasks:")
         for task_id, message in failed.items():
-            print(f"  - {task_id}: {message}")
+            lines.append(f"  - {task_id}: {message}")
 
     if convoy:
-        print("")
-        print(f"Convoy Created: {convoy['convoy_id']} ({convoy['convoy_name']})")
-        print("")
-        print("Next Steps:")
-        print("  1. Verify beads: bd list")
-        print("  2. Check dependencies: bd ready")
-        print("  3. Start epic work with the Mayor:")
-        print("     gt mayor attach")
+        lines.append("")
+        lines.append(f"Convoy Created: {convoy['convoy_id']} ({convoy['convoy_name']})")
+        lines.append("")
+        lines.append("Next Steps:")
+        lines.append("  1. Verify beads: bd list")
+        lines.append("  2. Check dependencies: bd ready")
+        lines.append("  3. Start epic work with the Mayor:")
+        lines.append("     gt mayor attach")
     else:
-        print("")
-        print("Next Steps:")
-        print("  1. Verify beads: bd list")
-        print("  2. Check dependencies: bd ready")
+        lines.append("")
+        lines.append("Next Steps:")
+        lines.append("  1. Verify beads: bd list")
+        lines.append("  2. Check dependencies: bd ready")
+
+    lines.append("")
+    lines.append(f"Mapping File: {feature_dir / 'beads-mapping.json'}")
 
-    print("")
-    print(f"Mapping File: {feature_dir / 'beads-mapping.json'}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main(argv: Optional[list[str]] = None) -> int:
@@ -2,24 +2,21 @@
 from __future__ import annotations
 
 import argparse
-import importlib.util
 import sys
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 REPO_ROOT = SCRIPT_DIR.parent
-MODULE_PATH = REPO_ROOT / "src" / "specify_cli" / "template_packager.py"
 
-spec = importlib.util.spec_from_file_location("template_packager", MODULE_PATH)
-if spec is None or spec.loader is None:
-    raise SystemExit("ERROR: Failed to load template_packager module.")
-template_packager = importlib.util.module_from_spec(spec)
-sys.modules["template_packager"] = template_packager
-spec.loader.exec_module(template_packager)
+# Import the packager module directly rather than through the specify_cli
+# package, whose __init__ pulls in the CLI's runtime dependencies.
+sys.path.insert(0, str(REPO_ROOT / "src" / "specify_cli"))
 
-TemplatePackagerError = template_packager.TemplatePackagerError
-build_commands_for_agents = template_packager.build_commands_for_agents
-AGENT_OUTPUT = template_packager.AGENT_OUTPUT
+from template_packager import (  # noqa: E402
+    AGENT_OUTPUT,
+    TemplatePackagerError,
+    build_commands_for_agents,
+)
 
 
 def parse_args() -> argparse.Namespace:
@@ -1,33 +1,54 @@
 from __future__ import annotations
 
+import os
 import re
 import shutil
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Iterable
-
-AGENT_OUTPUT = {
-    "claude": (".claude/commands", "md", "$ARGUMENTS"),
-    "gemini": (".gemini/commands", "toml", "{{args}}"),
-    "copilot": (".github/agents", "agent.md", "$ARGUMENTS"),
-    "cursor-agent": (".cursor/commands", "md", "$ARGUMENTS"),
-    "qwen": (".qwen/commands", "toml", "{{args}}"),
-    "opencode": (".opencode/command", "md", "$ARGUMENTS"),
-    "windsurf": (".windsurf/workflows", "md", "$ARGUMENTS"),
-    "codex": (".codex/prompts", "md", "$ARGUMENTS"),
-    "kilocode": (".kilocode/workflows", "md", "$ARGUMENTS"),
-    "auggie": (".augment/commands", "md", "$ARGUMENTS"),
-    "roo": (".roo/commands", "md", "$ARGUMENTS"),
-    "codebuddy": (".codebuddy/commands", "md", "$ARGUMENTS"),
-    "qoder": (".qoder/commands", "md", "$ARGUMENTS"),
-    "amp": (".agents/commands", "md", "$ARGUMENTS"),
-    "shai": (".shai/commands", "md", "$ARGUMENTS"),
-    "q": (".amazonq/prompts", "md", "$ARGUMENTS"),
-    "bob": (".bob/commands", "md", "$ARGUMENTS"),
+from pathlib import Path, PurePosixPath
+from typing import Iterable, NamedTuple
+
+
+class AgentSpec(NamedTuple):
+    commands_dir: PurePosixPath
+    extension: str
+    arg_format: str
+
+
+AGENT_OUTPUT: dict[str, AgentSpec] = {
+    "claude": AgentSpec(PurePosixPath(".claude/commands"), "md", "$ARGUMENTS"),
+    "gemini": AgentSpec(PurePosixPath(".gemini/commands"), "toml", "{{args}}"),
+    "copilot": AgentSpec(PurePosixPath(".github/agents"), "agent.md", "$ARGUMENTS"),
+    "cursor-agent": AgentSpec(PurePosixPath(".cursor/commands"), "md", "$ARGUMENTS"),
+    "qwen": AgentSpec(PurePosixPath(".qwen/commands"), "toml", "{{args}}"),
+    "opencode": AgentSpec(PurePosixPath(".opencode/command"), "md", "$ARGUMENTS"),
+    "windsurf": AgentSpec(PurePosixPath(".windsurf/workflows"), "md", "$ARGUMENTS"),
+    "codex": AgentSpec(PurePosixPath(".codex/prompts"), "md", "$ARGUMENTS"),
+    "kilocode": AgentSpec(PurePosixPath(".kilocode/workflows"), "md", "$ARGUMENTS"),
+    "auggie": AgentSpec(PurePosixPath(".augment/commands"), "md", "$ARGUMENTS"),
+    "roo": AgentSpec(PurePosixPath(".roo/commands"), "md", "$ARGUMENTS"),
+    "codebuddy": AgentSpec(PurePosixPath(".codebuddy/commands"), "md", "$ARGUMENTS"),
+    "qoder": AgentSpec(PurePosixPath(".qoder/commands"), "md", "$ARGUMENTS"),
+    "amp": AgentSpec(PurePosixPath(".agents/commands"), "md", "$ARGUMENTS"),
+    "shai": AgentSpec(PurePosixPath(".shai/commands"), "md", "$ARGUMENTS"),
+    "q": AgentSpec(PurePosixPath(".amazonq/prompts"), "md", "$ARGUMENTS"),
+    "bob": AgentSpec(PurePosixPath(".bob/commands"), "md", "$ARGUMENTS"),
 }
 
+_DESC_RE = re.compile(r"^description:\s*(.*)$")
+_KEY_RE = re.compile(r"^[A-Za-z_].*:\s*$")
+_PATH_PREFIXES = ("memory/", "scripts/", "templates/")
 
-@dataclass
+# Constant scaffolding for generated files, encoded once at import.
+_TOML_DESCRIPTION_OPEN = b'description = "'
+_TOML_PROMPT_OPEN = b'"\n\nprompt = """\n'
+_TOML_PROMPT_CLOSE = b'\n"""'
+_PROMPT_PREFIX = b"---\nagent: "
+_PROMPT_SUFFIX = b"\n---\n"
+
+
+@dataclass(frozen=True)
 class TemplateParseResult:
     description: str
     script_command: str | None
@@ -40,87 +61,146 @@ class TemplatePackagerError(RuntimeError):
 
 
 def _normalize_newlines(text: str) -> str:
+    # str.splitlines() would also split on form feeds and Unicode separators,
+    # so keep the explicit replaces and skip them for LF-only files.
+    if "\r" not in text:
+        return text
     return text.replace("\r\n", "\n").replace("\r", "\n")
 
 
 def _split_frontmatter(content: str) -> tuple[str | None, str]:
     if not content.startswith("---\n"):
         return None, content
-    parts = content.split("---\n", 2)
-    if len(parts) < 3:
+    frontmatter, sep, rest = content[4:].partition("---\n")
+    if not sep:
         return None, content
-    _, frontmatter, rest = parts
     return frontmatter, rest
 
 
-def _extract_description(frontmatter_lines: Iterable[str]) -> str:
-    for line in frontmatter_lines:
-        match = re.match(r"^description:\s*(.*)$", line.strip())
-        if match:
-            return match.group(1).strip().strip('"')
-    return ""
-
-
-def _extract_script(frontmatter_lines: list[str], script_variant: str, *, block_name: str) -> str | None:
-    in_block = False
-    for line in frontmatter_lines:
-        stripped = line.strip()
-        if stripped == f"{block_name}:":
-            in_block = True
-            continue
-        if in_block and re.match(r"^[A-Za-z_].*:\s*$", stripped):
-            in_block = False
-        if in_block:
-            if stripped.startswith(f"{script_variant}:"):
-                return stripped.split(":", 1)[1].strip()
-    return None
-
-
-def _strip_script_blocks(frontmatter_lines: list[str]) -> list[str]:
-    filtered: list[str] = []
+def _parse_frontmatter(
+    frontmatter_lines: list[str],
+    script_variant: str,
+    *,
+    has_script_blocks: bool = True,
+) -> tuple[str, str | None, str | None, list[str]]:
+    """Walk the frontmatter once, returning (description, script, agent_script, filtered_lines).
+
+    The scripts/agent_scripts blocks are dropped from the filtered lines, which are
+    also trimmed of leading and trailing blank entries, and the first command for
+    ``script_variant`` in each block is captured. Callers that know there are no
+    script blocks can pass ``has_script_blocks=False`` to skip the block state
+    machines entirely.
+    """
+    if not has_script_blocks:
+        for line in frontmatter_lines:
+            match = _DESC_RE.match(line.strip())
+            if match:
+                return match.group(1).strip().strip('"'), None, None, _trim_blank_lines(frontmatter_lines)
+        return "", None, None, _trim_blank_lines(frontmatter_lines)
+
+    variant_prefix = f"{script_variant}:"
+    description: str | None = None
+    script_command: str | None = None
+    agent_script_command: str | None = None
+    in_scripts = False
+    in_agent_scripts = False
     skipping = False
+    filtered: list[str] = []
 
     for line in frontmatter_lines:
         stripped = line.strip()
+        is_key = bool((in_scripts or in_agent_scripts or skipping) and _KEY_RE.match(stripped))
+
+        if description is None:
+            match = _DESC_RE.match(stripped)
+            if match:
+                description = match.group(1).strip().strip('"')
+
+        if script_command is None:
+            if stripped == "scripts:":
+                in_scripts = True
+            else:
+                if in_scripts and is_key:
+                    in_scripts = False
+                if in_scripts and stripped.startswith(variant_prefix):
+                    script_command = stripped.split(":", 1)[1].strip()
+
+        if agent_script_command is None:
+            if stripped == "agent_scripts:":
+                in_agent_scripts = True
+            else:
+                if in_agent_scripts and is_key:
+                    in_agent_scripts = False
+                if in_agent_scripts and stripped.startswith(variant_prefix):
+                    agent_script_command = stripped.split(":", 1)[1].strip()
+
         if stripped in {"scripts:", "agent_scripts:"}:
             skipping = True
             continue
-
         if skipping:
-            if re.match(r"^[A-Za-z_].*:\s*$", stripped):
+            if is_key:
                 skipping = False
                 filtered.append(line)
             continue
-
         filtered.append(line)
 
-    return filtered
+    return description or "", script_command, agent_script_command, _trim_blank_lines(filtered)
+
+
+def _trim_blank_lines(lines: list[str]) -> list[str]:
+    # In place, so that "\n".join(lines) matches "\n".join(original).strip("\n").
+    while lines and not lines[-1]:
+        lines.pop()
+    start = 0
+    while start < len(lines) and not lines[start]:
+        start += 1
+    if start:
+        del lines[:start]
+    return lines
 
 
 def _rewrite_paths(content: str) -> str:
-    for name in ("memory", "scripts", "templates"):
-        content = re.sub(rf"/?{name}/", f".specify/{name}/", content)
+    # Equivalent to re.sub(r"/?<name>/", ".specify/<name>/") using only str.split/join:
+    # a slash directly before a match is consumed unless an earlier match already used it.
+    for name in _PATH_PREFIXES:
+        parts = content.split(name)
+        if len(parts) == 1:
+            continue
+        head = [part[:-1] if part.endswith("/") else part for part in parts[:-1]]
+        head.append(parts[-1])
+        content = f".specify/{name}".join(head)
     return content
 
 
 def parse_template(path: Path, *, script_variant: str) -> TemplateParseResult:
+    # Results are cached per process; the stat key invalidates entries when a template changes.
+    stat = path.stat()
+    return _parse_template_cached(str(path), stat.st_mtime_ns, stat.st_size, script_variant)
+
+
+@lru_cache(maxsize=512)
+def _parse_template_cached(path_str: str, mtime_ns: int, size: int, script_variant: str) -> TemplateParseResult:
+    path = Path(path_str)
     raw = _normalize_newlines(path.read_text(encoding="utf-8"))
     frontmatter, body = _split_frontmatter(raw)
     if frontmatter is None:
         raise TemplatePackagerError(f"Missing YAML frontmatter in {path}")
 
-    frontmatter_lines = frontmatter.split("\n")
-    description = _extract_description(frontmatter_lines)
-    script_command = _extract_script(frontmatter_lines, script_variant, block_name="scripts")
-    agent_script_command = _extract_script(frontmatter_lines, script_variant, block_name="agent_scripts")
+    description, script_command, agent_script_command, filtered_lines = _parse_frontmatter(
+        frontmatter.split("\n"),
+        script_variant,
+        # Substring check in C; also covers "agent_scripts:".
+        has_script_blocks="scripts:" in frontmatter,
+    )
 
-    frontmatter_filtered = "\n".join(_strip_script_blocks(frontmatter_lines)).strip("\n")
-    rebuilt = f"---\n{frontmatter_filtered}\n---\n{body.lstrip()}"
+    rebuilt = "---\n" + "\n".join(filtered_lines) + "\n---\n" + body.lstrip()
 
     if script_command:
         rebuilt = rebuilt.replace("{SCRIPT}", script_command)
     if agent_script_command:
         rebuilt = rebuilt.replace("{AGENT_SCRIPT}", agent_script_command)
+    # Path rewriting is agent-independent, so do it once here rather than per render.
+    rebuilt = _rewrite_paths(rebuilt)
 
     return TemplateParseResult(
         description=description,
@@ -130,6 +210,19 @@ def parse_template(path: Path, *, script_variant: str) -> TemplateParseResult:
     )
 
 
+def parse_templates(templates_dir: Path, *, script_variant: str) -> list[tuple[Path, TemplateParseResult]]:
+    # scandir reports file type from the directory read, avoiding a stat per entry.
+    try:
+        with os.scandir(templates_dir) as entries:
+            names = sorted(entry.name for entry in entries if entry.name.endswith(".md") and entry.is_file())
+    except (FileNotFoundError, NotADirectoryError):
+        names = []
+    if not names:
+        raise TemplatePackagerError(f"No command templates found in {templates_dir}")
+    templates = [templates_dir / name for name in names]
+    return [(path, parse_template(path, script_variant=script_variant)) for path in templates]
+
+
 def render_template(
     template: TemplateParseResult,
     *,
@@ -138,36 +231,44 @@ def render_template(
 ) -> str:
     content = template.content.replace("{ARGS}", arg_format)
     content = content.replace("__AGENT__", agent)
-    content = _rewrite_paths(content)
     return content
 
 
+def _ensure_dir(path: Path, ensured: set[Path] | None = None) -> None:
+    if ensured is not None and path in ensured:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    if ensured is not None:
+        ensured.add(path)
+
+
 def write_command_file(
     *,
     output_path: Path,
     extension: str,
     description: str,
     content: str,
+    ensured: set[Path] | None = None,
 ) -> None:
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(output_path.parent, ensured)
 
+    # write_bytes skips the text layer's newline translation, so output is LF on every platform.
     if extension == "toml":
-        body = content.replace("\\", "\\\\")
-        output_path.write_text(
-            "\n".join(
+        body = content.replace("\\", "\\\\") if "\\" in content else content
+        output_path.write_bytes(
+            b"".join(
                 [
-                    f"description = \"{description}\"",
-                    "",
-                    "prompt = \"\"\"",
-                    body,
-                    "\"\"\"",
+                    _TOML_DESCRIPTION_OPEN,
+                    description.encode("utf-8"),
+                    _TOML_PROMPT_OPEN,
+                    body.encode("utf-8"),
+                    _TOML_PROMPT_CLOSE,
                 ]
-            ),
-            encoding="utf-8",
+            )
         )
         return
 
-    output_path.write_text(content, encoding="utf-8")
+    output_path.write_bytes(content.encode("utf-8"))
 
 
 def write_copilot_prompts(agents_dir: Path, prompts_dir: Path) -> None:
@@ -175,15 +276,24 @@ def write_copilot_prompts(agents_dir: Path, prompts_dir: Path) -> None:
     for agent_file in agents_dir.glob("speckit.*.agent.md"):
         basename = agent_file.stem.replace(".agent", "")
         prompt_file = prompts_dir / f"{basename}.prompt.md"
-        prompt_file.write_text(
-            "\n".join([
-                "---",
-                f"agent: {basename}",
-                "---",
-                "",
-            ]),
-            encoding="utf-8",
-        )
+        prompt_file.write_bytes(_PROMPT_PREFIX + basename.encode("utf-8") + _PROMPT_SUFFIX)
+
+
+def _copy_lib(output_dir: Path) -> list[Path]:
+    written: list[Path] = []
+    lib_dir = Path("lib")
+    if lib_dir.exists():
+        dest_lib = output_dir / ".specify" / "lib"
+        dest_lib.mkdir(parents=True, exist_ok=True)
+        for item in lib_dir.iterdir():
+            if item.is_file():
+                dest = dest_lib / item.name
+                # Break hardlinks left by earlier builds; copying through one would edit lib/ itself.
+                if dest.exists() and dest.resolve() != item.resolve() and os.path.samefile(item, dest):
+                    dest.unlink()
+                shutil.copy2(item, dest)
+                written.append(dest)
+    return written
 
 
 def build_commands(
@@ -193,29 +303,27 @@ def build_commands(
     agent: str,
     script_variant: str,
     include_vscode_settings: bool = False,
+    parsed: list[tuple[Path, TemplateParseResult]] | None = None,
+    copy_lib: bool = True,
 ) -> list[Path]:
-    if agent not in AGENT_OUTPUT:
+    spec = AGENT_OUTPUT.get(agent)
+    if spec is None:
         raise TemplatePackagerError(f"Unsupported agent: {agent}")
 
-    commands_dir, extension, arg_format = AGENT_OUTPUT[agent]
-    output_commands_dir = output_dir / commands_dir
-    templates = sorted(templates_dir.glob("*.md"))
-    if not templates:
-        raise TemplatePackagerError(f"No command templates found in {templates_dir}")
+    extension = spec.extension
+    arg_format = spec.arg_format
+    output_commands_dir = output_dir / spec.commands_dir
+    if parsed is None:
+        parsed = parse_templates(templates_dir, script_variant=script_variant)
 
     written: list[Path] = []
+    # Directories created during this call; every template shares one parent.
+    ensured: set[Path] = set()
 
-    lib_dir = Path("lib")
-    if lib_dir.exists():
-        dest_lib = output_dir / ".specify" / "lib"
-        dest_lib.mkdir(parents=True, exist_ok=True)
-        for item in lib_dir.iterdir():
-            if item.is_file():
-                shutil.copy2(item, dest_lib / item.name)
-                written.append(dest_lib / item.name)
+    if copy_lib:
+        written.extend(_copy_lib(output_dir))
 
-    for template_path in templates:
-        result = parse_template(template_path, script_variant=script_variant)
+    for template_path, result in parsed:
         rendered = render_template(result, agent=agent, arg_format=arg_format)
 
         if extension == "toml":
@@ -231,6 +339,7 @@ def build_commands(
             extension="toml" if extension == "toml" else "md",
             description=result.description,
             content=rendered,
+            ensured=ensured,
         )
         written.append(output_path)
 
@@ -240,7 +349,7 @@ def build_commands(
             vscode_settings = Path("templates/vscode-settings.json")
             if vscode_settings.exists():
                 dest = output_dir / ".vscode" / "settings.json"
-                dest.parent.mkdir(parents=True, exist_ok=True)
+                _ensure_dir(dest.parent, ensured)
                 shutil.copy2(vscode_settings, dest)
                 written.append(dest)
 
@@ -256,12 +365,36 @@ def build_commands_for_agents(
     include_vscode_settings: bool = False,
 ) -> dict[str, list[Path]]:
     results: dict[str, list[Path]] = {}
-    for agent in agents:
-        results[agent] = build_commands(
-            templates_dir=templates_dir,
-            output_dir=output_dir,
-            agent=agent,
-            script_variant=script_variant,
-            include_vscode_settings=include_vscode_settings,
-        )
+    agent_list = list(dict.fromkeys(agents))
+    if not agent_list:
+        return results
+    for agent in agent_list:
+        if agent not in AGENT_OUTPUT:
+            raise TemplatePackagerError(f"Unsupported agent: {agent}")
+
+    # Parsing only depends on the script variant, so share it across agents.
+    parsed = parse_templates(templates_dir, script_variant=script_variant)
+    # The lib copy is identical for every agent; do it once so worker threads
+    # only ever write to their own agent's output directory.
+    lib_written = _copy_lib(output_dir)
+
+    with ThreadPoolExecutor(max_workers=min(8, len(agent_list))) as executor:
+        futures = [
+            (
+                agent,
+                executor.submit(
+                    build_commands,
+                    templates_dir=templates_dir,
+                    output_dir=output_dir,
+                    agent=agent,
+                    script_variant=script_variant,
+                    include_vscode_settings=include_vscode_settings,
+                    parsed=parsed,
+                    copy_lib=False,
+                ),
+            )
+            for agent in agent_list
+        ]
+        for agent, future in futures:
+            results[agent] = lib_written + future.result()
     return results
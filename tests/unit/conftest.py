@@ -0,0 +1,18 @@
+import importlib.util
+from pathlib import Path
+import sys
+
+import pytest
+
+
+@pytest.fixture
+def task_parser():
+    repo_root = Path(__file__).resolve().parents[2]
+    module_path = repo_root / "lib" / "task_parser.py"
+    spec = importlib.util.spec_from_file_location("task_parser", module_path)
+    module = importlib.util.module_from_spec(spec)
+    # dataclasses look up the defining module in sys.modules.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    yield module
+    sys.modules.pop(spec.name, None)
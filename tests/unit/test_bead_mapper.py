@@ -1,18 +1,7 @@
-import importlib.util
-from pathlib import Path
+import os
 
 
-def load_task_parser():
-    repo_root = Path(__file__).resolve().parents[2]
-    module_path = repo_root / ".specify" / "lib" / "task_parser.py"
-    spec = importlib.util.spec_from_file_location("task_parser", module_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
-
-
-def test_mapping_serialization_roundtrip(tmp_path):
-    task_parser = load_task_parser()
+def test_mapping_serialization_roundtrip(task_parser, tmp_path):
     mapping = task_parser.TaskBeadMapping(
         version=task_parser.CURRENT_MAPPING_VERSION,
         feature_dir=str(tmp_path),
@@ -36,8 +25,7 @@ def test_mapping_serialization_roundtrip(tmp_path):
     assert loaded.mappings["T001"].bead_id == "bd-test1"
 
 
-def test_duplicate_detection():
-    task_parser = load_task_parser()
+def test_duplicate_detection(task_parser):
     mapping = task_parser.TaskBeadMapping(
         version=task_parser.CURRENT_MAPPING_VERSION,
         feature_dir="/tmp/feature",
@@ -52,8 +40,7 @@ def test_duplicate_detection():
     assert task_parser.is_duplicate("T002", mapping) is False
 
 
-def test_parent_bead_determination():
-    task_parser = load_task_parser()
+def test_parent_bead_determination(task_parser):
     task = task_parser.Task(
         task_id="T001",
         is_parallel=False,
@@ -70,8 +57,7 @@ def test_parent_bead_determination():
     assert "User Story 1" in title
 
 
-def test_convoy_name_fallback(tmp_path, monkeypatch):
-    task_parser = load_task_parser()
+def test_convoy_name_fallback(task_parser, tmp_path, monkeypatch):
     feature_dir = tmp_path / "specs" / "001-feature"
     feature_dir.mkdir(parents=True)
     (feature_dir / "spec.md").write_text("# My Feature", encoding="utf-8")
@@ -83,8 +69,7 @@ def test_convoy_name_fallback(tmp_path, monkeypatch):
     assert name == "My Feature"
 
 
-def test_phase_priority_mapping(tmp_path):
-    task_parser = load_task_parser()
+def test_phase_priority_mapping(task_parser, tmp_path):
     content = "\n".join(
         [
             "## Phase 1: Setup (Shared Infrastructure)",
@@ -102,3 +87,127 @@ def test_phase_priority_mapping(tmp_path):
     assert tasks[0].phase_priority == 0
     assert tasks[1].phase_priority == 1
     assert tasks[2].phase_priority == 2
+
+
+def make_mapping(task_parser, tmp_path, bead_ids):
+    return task_parser.TaskBeadMapping(
+        version=task_parser.CURRENT_MAPPING_VERSION,
+        feature_dir=str(tmp_path),
+        branch_name="branch",
+        created_at="",
+        last_updated="",
+        mappings={
+            f"T00{n}": task_parser.BeadMappingEntry(bead_id, "", "Task")
+            for n, bead_id in enumerate(bead_ids, start=1)
+        },
+        convoy=None,
+        stats={},
+    )
+
+
+def set_mtime_ns(path, mtime_ns):
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_load_prefers_newer_inflight_checkpoint(task_parser, tmp_path):
+    task_parser.save_mapping(make_mapping(task_parser, tmp_path, ["bd-1"]), tmp_path)
+    task_parser.save_mapping_fast(make_mapping(task_parser, tmp_path, ["bd-1", "bd-2"]), tmp_path)
+    set_mtime_ns(tmp_path / "beads-mapping.json", 1_000_000_000)
+    set_mtime_ns(tmp_path / "beads-mapping.json.inflight", 2_000_000_000)
+
+    loaded = task_parser.load_mapping(tmp_path)
+    assert sorted(loaded.mappings) == ["T001", "T002"]
+
+
+def test_load_ignores_truncated_inflight_checkpoint(task_parser, tmp_path):
+    task_parser.save_mapping(make_mapping(task_parser, tmp_path, ["bd-1"]), tmp_path)
+    inflight_path = tmp_path / "beads-mapping.json.inflight"
+    task_parser.save_mapping_fast(make_mapping(task_parser, tmp_path, ["bd-1", "bd-2"]), tmp_path)
+    inflight_path.write_bytes(inflight_path.read_bytes()[:-10])
+    set_mtime_ns(tmp_path / "beads-mapping.json", 1_000_000_000)
+    set_mtime_ns(inflight_path, 2_000_000_000)
+
+    loaded = task_parser.load_mapping(tmp_path)
+    assert sorted(loaded.mappings) == ["T001"]
+
+
+def test_load_ignores_inflight_checkpoint_torn_inside_utf8(task_parser, tmp_path):
+    task_parser.save_mapping(make_mapping(task_parser, tmp_path, ["bd-1"]), tmp_path)
+    mapping = make_mapping(task_parser, tmp_path, ["bd-1", "bd-2"])
+    mapping.mappings["T002"].title = "Café"
+    inflight_path = tmp_path / "beads-mapping.json.inflight"
+    task_parser.save_mapping_fast(mapping, tmp_path)
+    raw = inflight_path.read_bytes()
+    # Cut between the two bytes of the "é".
+    inflight_path.write_bytes(raw[: raw.index("é".encode("utf-8")) + 1])
+    set_mtime_ns(tmp_path / "beads-mapping.json", 1_000_000_000)
+    set_mtime_ns(inflight_path, 2_000_000_000)
+
+    loaded = task_parser.load_mapping(tmp_path)
+    assert sorted(loaded.mappings) == ["T001"]
+
+
+def test_load_ignores_older_inflight_checkpoint(task_parser, tmp_path):
+    task_parser.save_mapping_fast(make_mapping(task_parser, tmp_path, ["bd-1"]), tmp_path)
+    inflight_path = tmp_path / "beads-mapping.json.inflight"
+    saved = inflight_path.read_bytes()
+    task_parser.save_mapping(make_mapping(task_parser, tmp_path, ["bd-1", "bd-2"]), tmp_path)
+    # Simulate a stale checkpoint left next to a newer final save.
+    inflight_path.write_bytes(saved)
+    set_mtime_ns(inflight_path, 1_000_000_000)
+    set_mtime_ns(tmp_path / "beads-mapping.json", 2_000_000_000)
+
+    loaded = task_parser.load_mapping(tmp_path)
+    assert sorted(loaded.mappings) == ["T001", "T002"]
+
+
+def test_save_mapping_removes_inflight_checkpoint(task_parser, tmp_path):
+    mapping = make_mapping(task_parser, tmp_path, ["bd-1"])
+    task_parser.save_mapping_fast(mapping, tmp_path)
+    assert (tmp_path / "beads-mapping.json.inflight").exists()
+
+    task_parser.save_mapping(mapping, tmp_path)
+    assert not (tmp_path / "beads-mapping.json.inflight").exists()
+    assert task_parser.load_mapping(tmp_path).mappings["T001"].bead_id == "bd-1"
+
+
+def test_collect_bead_ids_reflects_current_mappings(task_parser, tmp_path):
+    mapping = make_mapping(task_parser, tmp_path, ["bd-1", "bd-2"])
+    assert task_parser._collect_bead_ids(mapping) == ["bd-1", "bd-2"]
+
+    del mapping.mappings["T002"]
+    mapping.mappings["T003"] = task_parser.BeadMappingEntry("bd-3", "", "Task")
+    assert task_parser._collect_bead_ids(mapping) == ["bd-1", "bd-3"]
+
+
+def test_save_mapping_writes_entries_changed_in_place(task_parser, tmp_path):
+    mapping = make_mapping(task_parser, tmp_path, ["bd-1"])
+    task_parser.save_mapping(mapping, tmp_path)
+    mapping.mappings["T001"].title = "Renamed"
+
+    task_parser.save_mapping(mapping, tmp_path)
+    assert task_parser.load_mapping(tmp_path).mappings["T001"].title == "Renamed"
+
+
+def test_failed_bead_still_counts_toward_checkpoint(task_parser, tmp_path, monkeypatch):
+    tasks = [
+        task_parser.Task(f"T00{n}", True, None, f"Task {n}", None, [], "Setup", 0, n)
+        for n in (1, 2)
+    ]
+    mapping = task_parser.load_existing_mapping(tmp_path)
+    checkpoints = []
+
+    def fake_create_bead(title, **kwargs):
+        if title == "Task 2":
+            raise RuntimeError("forced failure")
+        return "bd-1"
+
+    def fake_save_mapping_fast(mapping, feature_dir):
+        checkpoints.append(len(mapping.mappings))
+
+    monkeypatch.setattr(task_parser, "create_bead", fake_create_bead)
+    monkeypatch.setattr(task_parser, "save_mapping_fast", fake_save_mapping_fast)
+
+    result = task_parser.create_beads_from_tasks(tasks, mapping, tmp_path, tmp_path, log_handle=None)
+    assert list(result["failed"]) == ["T002"]
+    assert checkpoints == [1, 1]
@@ -1,27 +1,42 @@
-import importlib.util
-from pathlib import Path
 import textwrap
 
 import pytest
 
 
-def load_task_parser():
-    repo_root = Path(__file__).resolve().parents[2]
-    module_path = repo_root / ".specify" / "lib" / "task_parser.py"
-    spec = importlib.util.spec_from_file_location("task_parser", module_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+def make_dependency_fixture(task_parser, tmp_path):
+    content = textwrap.dedent(
+        """
+        ## Phase 1: Setup (Shared Infrastructure)
+        - [ ] T001 [P] First task
+        - [ ] T002 [P] Second task
+        - [ ] T003 [P] Third task (depends on T001, T002)
+        """
+    ).strip()
+    tasks_path = tmp_path / "tasks.md"
+    tasks_path.write_text(content, encoding="utf-8")
+    tasks = task_parser.parse_tasks_file(tasks_path)
+    mapping = task_parser.TaskBeadMapping(
+        version=task_parser.CURRENT_MAPPING_VERSION,
+        feature_dir=str(tmp_path),
+        branch_name="branch",
+        created_at="",
+        last_updated="",
+        mappings={
+            task_id: task_parser.BeadMappingEntry(f"bd-{task_id.lower()}", "", task_id)
+            for task_id in ("T001", "T002", "T003")
+        },
+        convoy=None,
+        stats={},
+    )
+    return tasks, mapping
 
 
-def test_phase_header_extraction():
-    task_parser = load_task_parser()
+def test_phase_header_extraction(task_parser):
     header = "## Phase 1: Setup (Shared Infrastructure)"
     assert task_parser.parse_phase_header(header) == "Setup (Shared Infrastructure)"
 
 
-def test_task_line_parsing_and_dependencies(tmp_path):
-    task_parser = load_task_parser()
+def test_task_line_parsing_and_dependencies(task_parser, tmp_path):
     content = textwrap.dedent(
         """
         ## Phase 1: Setup (Shared Infrastructure)
@@ -41,8 +56,7 @@ def test_task_line_parsing_and_dependencies(tmp_path):
     assert tasks[1].dependencies == ["T001"]
 
 
-def test_dependency_parsing_clean_description():
-    task_parser = load_task_parser()
+def test_dependency_parsing_clean_description(task_parser):
     deps, cleaned = task_parser.parse_dependencies(
         "Implement service (depends on T012, T013)"
     )
@@ -50,8 +64,7 @@ def test_dependency_parsing_clean_description():
     assert cleaned == "Implement service"
 
 
-def test_malformed_task_line_warning(tmp_path, capsys):
-    task_parser = load_task_parser()
+def test_malformed_task_line_warning(task_parser, tmp_path, capsys):
     content = textwrap.dedent(
         """
         ## Phase 1: Setup (Shared Infrastructure)
@@ -68,8 +81,7 @@ def test_malformed_task_line_warning(tmp_path, capsys):
     assert "Malformed task line" in stderr
 
 
-def test_empty_tasks_file(tmp_path):
-    task_parser = load_task_parser()
+def test_empty_tasks_file(task_parser, tmp_path):
     tasks_path = tmp_path / "tasks.md"
     tasks_path.write_text("## Phase 1: Setup", encoding="utf-8")
 
@@ -77,8 +89,7 @@ def test_empty_tasks_file(tmp_path):
         task_parser.parse_tasks_file(tasks_path)
 
 
-def test_circular_dependency_detection(tmp_path):
-    task_parser = load_task_parser()
+def test_circular_dependency_detection(task_parser, tmp_path):
     content = textwrap.dedent(
         """
         ## Phase 1: Setup (Shared Infrastructure)
@@ -94,8 +105,7 @@ def test_circular_dependency_detection(tmp_path):
     assert cycle is not None
 
 
-def test_validate_dependencies_missing_target(tmp_path):
-    task_parser = load_task_parser()
+def test_validate_dependencies_missing_target(task_parser, tmp_path):
     content = textwrap.dedent(
         """
         ## Phase 1: Setup (Shared Infrastructure)
@@ -110,8 +120,7 @@ def test_validate_dependencies_missing_target(tmp_path):
         task_parser.validate_dependencies(tasks)
 
 
-def test_task_id_validation_errors(tmp_path):
-    task_parser = load_task_parser()
+def test_task_id_validation_errors(task_parser, tmp_path):
     content = textwrap.dedent(
         """
         ## Phase 1: Setup (Shared Infrastructure)
@@ -125,3 +134,91 @@ def test_task_id_validation_errors(tmp_path):
     tasks = task_parser.parse_tasks_file(tasks_path)
     with pytest.raises(ValueError):
         task_parser.validate_task_ids(tasks)
+
+
+def test_dependency_failures_are_reported_per_edge(task_parser, tmp_path, monkeypatch):
+    tasks, mapping = make_dependency_fixture(task_parser, tmp_path)
+    calls = []
+
+    def fake_run_bd_command(args, timeout=30):
+        calls.append(args)
+        if args[-1] == "bd-t001":
+            return 1, "", "unknown issue bd-t001"
+        return 0, "", ""
+
+    monkeypatch.setattr(task_parser, "run_bd_command", fake_run_bd_command)
+
+    warnings = task_parser.create_bead_dependencies(tasks, mapping, log_handle=None)
+    assert calls == [
+        ["dep", "add", "bd-t003", "bd-t001"],
+        ["dep", "add", "bd-t003", "bd-t002"],
+    ]
+    assert len(warnings) == 1
+    assert "T003 (bd-t003) depends on T001 (bd-t001): unknown issue bd-t001" in warnings[0]
+
+
+def test_fused_line_pattern_parses_headers_and_task_lines(task_parser, tmp_path):
+    content = textwrap.dedent(
+        """
+        ## Phase 1: Setup (Shared Infrastructure)
+          - [ ] T001 [P] [US2]   Indented task in src/a.py
+        ## Phase 3: User Story 1 - Parser (Priority: P1)
+        - [ ] T002 Story task (depends on T001)
+        - [x] T003 Completed task is ignored
+        """
+    ).strip()
+    tasks_path = tmp_path / "tasks.md"
+    tasks_path.write_text(content, encoding="utf-8")
+
+    tasks = task_parser.parse_tasks_file(tasks_path)
+    assert [(task.task_id, task.phase_name, task.line_number) for task in tasks] == [
+        ("T001", "Setup (Shared Infrastructure)", 2),
+        ("T002", "User Story 1 - Parser (Priority: P1)", 4),
+    ]
+    assert tasks[0].is_parallel is True
+    assert tasks[0].user_story == "US2"
+    assert tasks[0].description == "Indented task in src/a.py"
+    assert tasks[1].dependencies == ["T001"]
+    assert tasks[1].phase_priority == 2
+
+
+def test_sort_moves_dependency_ahead_of_dependent(task_parser, tmp_path):
+    content = textwrap.dedent(
+        """
+        ## Phase 1: Setup (Shared Infrastructure)
+        - [ ] T001 [P] Wire config (depends on T003)
+        - [ ] T002 [P] Write docs
+        - [ ] T003 [P] Create config module
+        """
+    ).strip()
+    tasks_path = tmp_path / "tasks.md"
+    tasks_path.write_text(content, encoding="utf-8")
+
+    ordered, cycle = task_parser.sort_tasks_by_dependencies(task_parser.parse_tasks_file(tasks_path))
+    assert cycle is None
+    assert [task.task_id for task in ordered] == ["T003", "T001", "T002"]
+
+
+def test_sort_keeps_file_order_when_already_sorted(task_parser, tmp_path):
+    content = textwrap.dedent(
+        """
+        ## Phase 1: Setup (Shared Infrastructure)
+        - [ ] T001 Create structure
+        - [ ] T002 [P] Add fixtures
+        - [ ] T003 Build parser (depends on T002)
+        ## Phase 2: Foundational (Blocking)
+        - [ ] T004 Add storage (depends on T001, T003)
+        """
+    ).strip()
+    tasks_path = tmp_path / "tasks.md"
+    tasks_path.write_text(content, encoding="utf-8")
+
+    ordered, cycle = task_parser.sort_tasks_by_dependencies(task_parser.parse_tasks_file(tasks_path))
+    assert cycle is None
+    assert [task.task_id for task in ordered] == ["T001", "T002", "T003", "T004"]
+
+
+def test_bead_id_parsing_prefers_first_match(task_parser):
+    assert task_parser._parse_bead_id("bd-x1") == "bd-x1"
+    assert task_parser._parse_bead_id("Created issue bd-x1\nnon-blocking") == "bd-x1"
+    assert task_parser._parse_convoy_id("Convoy gt-ab1 created\nsee gt-zz9") == "gt-ab1"
@@ -0,0 +1,92 @@
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+
+def load_template_packager():
+    repo_root = Path(__file__).resolve().parents[2]
+    module_path = repo_root / "src" / "specify_cli" / "template_packager.py"
+    spec = importlib.util.spec_from_file_location("template_packager", module_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_normalize_newlines_preserves_trailing_newline():
+    template_packager = load_template_packager()
+    assert template_packager._normalize_newlines("a\r\nb\r\n") == "a\nb\n"
+    assert template_packager._normalize_newlines("a\rb\r") == "a\nb\n"
+    assert template_packager._normalize_newlines("a\nb") == "a\nb"
+    assert template_packager._normalize_newlines("a\x0cb\n") == "a\x0cb\n"
+
+
+def test_render_substitutions_cannot_form_rewritten_paths():
+    template_packager = load_template_packager()
+    # Paths are rewritten at parse time, before {ARGS}/__AGENT__ are substituted.
+    # That is only equivalent if no substituted value can create or extend a path.
+    for agent, spec in template_packager.AGENT_OUTPUT.items():
+        for value in (agent, spec.arg_format):
+            assert "/" not in value
+            for name in ("memory", "scripts", "templates"):
+                assert name not in value
+
+
+def test_parse_template_rewrites_script_paths(tmp_path):
+    template_packager = load_template_packager()
+    template = tmp_path / "plan.md"
+    template.write_text(
+        "---\n"
+        "description: Plan\n"
+        "scripts:\n"
+        "  sh: scripts/bash/setup-plan.sh --json\n"
+        "---\n"
+        "Run {SCRIPT} with {ARGS} for __AGENT__ using /memory/constitution.md\n",
+        encoding="utf-8",
+    )
+    result = template_packager.parse_template(template, script_variant="sh")
+    rendered = template_packager.render_template(result, agent="claude", arg_format="$ARGUMENTS")
+    assert rendered.endswith(
+        "Run .specify/scripts/bash/setup-plan.sh --json with $ARGUMENTS for claude "
+        "using .specify/memory/constitution.md\n"
+    )
+
+
+def test_split_frontmatter_keeps_later_delimiters_in_body():
+    template_packager = load_template_packager()
+    content = "---\ndescription: x\n---\nbody\n---\nmore\n---\n"
+    assert template_packager._split_frontmatter(content) == (
+        "description: x\n",
+        "body\n---\nmore\n---\n",
+    )
+    assert template_packager._split_frontmatter("---\n---\nbody") == ("", "body")
+    assert template_packager._split_frontmatter("---\nno end") == (None, "---\nno end")
+    assert template_packager._split_frontmatter("body") == (None, "body")
+
+
+def test_parse_template_cache_tracks_file_changes(tmp_path):
+    template_packager = load_template_packager()
+    template = tmp_path / "spec.md"
+    template.write_text("---\ndescription: First\n---\nbody\n", encoding="utf-8")
+    first = template_packager.parse_template(template, script_variant="sh")
+    assert template_packager.parse_template(template, script_variant="sh") is first
+
+    template.write_text("---\ndescription: Second version\n---\nbody\n", encoding="utf-8")
+    assert template_packager.parse_template(template, script_variant="sh").description == "Second version"
+
+
+def test_copy_lib_never_hardlinks_source(tmp_path, monkeypatch):
+    template_packager = load_template_packager()
+    monkeypatch.chdir(tmp_path)
+    source = tmp_path / "lib" / "task_parser.py"
+    source.parent.mkdir()
+    source.write_text("VALUE = 1\n", encoding="utf-8")
+    dest = tmp_path / "out" / ".specify" / "lib" / "task_parser.py"
+    dest.parent.mkdir(parents=True)
+    os.link(source, dest)  # left behind by an earlier build
+
+    template_packager._copy_lib(tmp_path / "out")
+    dest.write_text("VALUE = 2\n", encoding="utf-8")
+    assert source.read_text(encoding="utf-8") == "VALUE = 1\n"
+    assert source.stat().st_nlink == 1